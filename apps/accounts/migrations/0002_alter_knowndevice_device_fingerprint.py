@@ -0,0 +1,67 @@
+# Generated by Django 5.2.4 on 2026-08-29 09:00
+
+import hashlib
+
+from django.db import migrations, models
+
+
+def rehash_fingerprints(apps, schema_editor):
+    """
+    Recompute stored fingerprints as 32-char BLAKE2s-128 hex digests.
+
+    Existing rows hold 64-char SHA-256 hex digests, which would both
+    overflow the narrowed varchar(32) column and never match the new
+    hashing scheme. The raw inputs (ip_address, user_agent) are stored on
+    the row, so every known device can be rehashed in place instead of
+    being dropped and re-flagged as unknown.
+    """
+    KnownDevice = apps.get_model('accounts', 'KnownDevice')
+    batch = []
+    for device in KnownDevice.objects.only(
+        'id', 'ip_address', 'user_agent'
+    ).iterator(chunk_size=1000):
+        raw = f"{device.ip_address}_{device.user_agent}"
+        device.device_fingerprint = hashlib.blake2s(
+            raw.encode(), digest_size=16
+        ).hexdigest()
+        batch.append(device)
+        if len(batch) >= 1000:
+            KnownDevice.objects.bulk_update(batch, ['device_fingerprint'])
+            batch = []
+    if batch:
+        KnownDevice.objects.bulk_update(batch, ['device_fingerprint'])
+
+
+def restore_sha256_fingerprints(apps, schema_editor):
+    """Reverse: recompute the original SHA-256 hex digests (column is wide again by now)."""
+    KnownDevice = apps.get_model('accounts', 'KnownDevice')
+    batch = []
+    for device in KnownDevice.objects.only(
+        'id', 'ip_address', 'user_agent'
+    ).iterator(chunk_size=1000):
+        raw = f"{device.ip_address}_{device.user_agent}"
+        device.device_fingerprint = hashlib.sha256(raw.encode()).hexdigest()
+        batch.append(device)
+        if len(batch) >= 1000:
+            KnownDevice.objects.bulk_update(batch, ['device_fingerprint'])
+            batch = []
+    if batch:
+        KnownDevice.objects.bulk_update(batch, ['device_fingerprint'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        # Rehash before narrowing the column: 64-char SHA-256 values would
+        # fail the varchar(32) cast on Postgres otherwise.
+        migrations.RunPython(rehash_fingerprints, restore_sha256_fingerprints),
+        migrations.AlterField(
+            model_name='knowndevice',
+            name='device_fingerprint',
+            field=models.CharField(db_index=True, max_length=32),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-08-29 09:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_alter_knowndevice_device_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='knowndevice',
+            constraint=models.UniqueConstraint(fields=('user', 'device_fingerprint'), name='uniq_user_fp'),
+        ),
+    ]
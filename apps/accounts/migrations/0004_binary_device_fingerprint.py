@@ -0,0 +1,32 @@
+# Generated by Django 5.2.4 on 2026-08-29 09:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_knowndevice_uniq_user_fp'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "ALTER TABLE accounts_knowndevice "
+                "ALTER COLUMN device_fingerprint TYPE bytea "
+                "USING decode(device_fingerprint, 'hex');"
+            ),
+            reverse_sql=(
+                "ALTER TABLE accounts_knowndevice "
+                "ALTER COLUMN device_fingerprint TYPE varchar(32) "
+                "USING encode(device_fingerprint, 'hex');"
+            ),
+            state_operations=[
+                migrations.AlterField(
+                    model_name='knowndevice',
+                    name='device_fingerprint',
+                    field=models.BinaryField(db_index=True, max_length=16),
+                ),
+            ],
+        ),
+    ]
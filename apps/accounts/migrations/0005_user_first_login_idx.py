@@ -0,0 +1,21 @@
+# Generated by Django 5.2.4 on 2026-08-29 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_binary_device_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(
+                condition=models.Q(('first_login', True)),
+                fields=['first_login'],
+                name='user_first_login_idx',
+            ),
+        ),
+    ]
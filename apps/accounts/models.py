@@ -21,13 +21,32 @@ class User(AbstractUser):
 
     class Meta:
         db_table = "user"
-    
+        indexes = [
+            # Partial index covering only users who haven't logged in yet:
+            # the login fast-path check stays fast however large the table grows.
+            models.Index(
+                fields=["first_login"],
+                name="user_first_login_idx",
+                condition=models.Q(first_login=True),
+            ),
+        ]
+
 class KnownDevice(models.Model):
     """
     To store known devices information to send information if logged in from unknown devices.
     """
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='known_devices')
-    device_fingerprint = models.CharField(max_length=512)
+    device_fingerprint = models.BinaryField(max_length=16, db_index=True)
     ip_address = models.GenericIPAddressField()
     user_agent = models.TextField()
-    last_used = models.DateTimeField(auto_now=True)
\ No newline at end of file
+    last_used = models.DateTimeField(auto_now=True)
+
+    @property
+    def fingerprint_hex(self) -> str:
+        """Hex rendering of the raw fingerprint bytes, for admin/display use."""
+        return bytes(self.device_fingerprint).hex()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'device_fingerprint'], name='uniq_user_fp')
+        ]
\ No newline at end of file
@@ -1,5 +1,10 @@
 import hashlib
+from functools import lru_cache
 
+@lru_cache(maxsize=4096)
 def get_device_fingerprint(ip, user_agent):
+    # Repeat logins from the same (ip, user_agent) pair skip the hash entirely.
+    # BLAKE2s with a 128-bit digest is faster than SHA-256 on scalar CPUs.
+    # Raw bytes (not hex) halve the stored fingerprint and its index again.
     raw = f"{ip}_{user_agent}"
-    return hashlib.sha256(raw.encode()).hexdigest()
\ No newline at end of file
+    return hashlib.blake2s(raw.encode(), digest_size=16).digest()
@@ -2,8 +2,8 @@ import logging
 from celery import shared_task
 
 from apps.notifications.notifications_tasks import send_email_notification, send_sms_notification
-from apps.accounts.models import User
-from apps.notifications.models import Notification, NotificationPreference
+from apps.notifications.models import Notification
+from apps.notifications.services import get_cached_preferences
 
 logger = logging.getLogger(__name__)
 
@@ -14,33 +14,32 @@ logger = logging.getLogger(__name__)
     time_limit=30
 )
 def handle_unknown_device_async(user_id, device_info):
-    try:
-        user = User.objects.get(id=user_id)
-        pref = NotificationPreference.objects.filter(user=user).first()
-            
-        message = "Unknown device login detected"
-        
-        notification = Notification.objects.create(
-            recipient=user,
-            message=message,
-            in_app_status=pref.in_app,
-            is_read=False
+    # Preferences come from the Redis cache; repeat invocations for the same
+    # user skip the DB entirely.
+    pref = get_cached_preferences(user_id)
+    if pref is None:
+        logger.error(f"Notification preference not found for unknown device notification: {user_id}")
+        return
+
+    # Short header for email/SMS; the stored notification carries the full
+    # message so a single INSERT suffices (no follow-up UPDATE).
+    header = "Unknown device login detected"
+
+    notification = Notification.objects.create(
+        recipient_id=user_id,
+        message=f"{header}\n\nDevice Info:\nIP: {device_info['ip']}\nUser Agent: {device_info['user_agent']}",
+        in_app_status=pref['in_app'],
+        is_read=False
+    )
+    if pref['email']:
+        send_email_notification.delay(
+            notification.id,
+            "Unknown Device Detected",
+            header
         )
-        if pref.email:
-            send_email_notification.delay(
-                notification.id,
-                "Unknown Device Detected",
-                message
-            )
-            
-        if pref.sms:
-            send_sms_notification.delay(
-                notification.id,
-                message[:160]
-            )
-            
-        notification.message = f"{message}\n\nDevice Info:\nIP: {device_info['ip']}\nUser Agent: {device_info['user_agent']}"
-        notification.save(update_fields=['message'])
-        
-    except User.DoesNotExist:
-        logger.error(f"User not found for unknown device notification: {user_id}")
\ No newline at end of file
+
+    if pref['sms']:
+        send_sms_notification.delay(
+            notification.id,
+            header[:160]
+        )
\ No newline at end of file
@@ -140,6 +140,20 @@ class CustomExceptionHandler:
         return self.response
 
 
+# Handler dispatch table built once at import instead of per request.
+# Ordered so subclasses (PageNotFoundException < NotFound) match first;
+# isinstance dispatch also catches exception subclasses that the previous
+# exact-class dict lookup sent to unknown_error().
+_HANDLER_METHODS = (
+    ("validation_error", ValidationError),
+    ("not_authenticated", NotAuthenticated),
+    ("permission_denied", PermissionDenied),
+    ("page_not_found", PageNotFoundException),
+    ("not_found", NotFound),
+    ("method_not_allowed", MethodNotAllowed),
+)
+
+
 def new_customer_exception_handler(exc, content):
     """
         A custom exception handler that handles various
@@ -158,21 +172,13 @@ def new_customer_exception_handler(exc, content):
         exc=exc, content=content, drf_exception=drf_exception
     )
     if drf_exception is not None:
-        # exception map which have different exception mapped
-        exception_map = {
-            ValidationError: exception_handler_instance.validation_error,
-            NotAuthenticated: exception_handler_instance.not_authenticated,
-            PermissionDenied: exception_handler_instance.permission_denied,
-            NotFound: exception_handler_instance.not_found,
-            PageNotFoundException: exception_handler_instance.page_not_found,
-            MethodNotAllowed: exception_handler_instance.method_not_allowed,
-        }
-        if not exception_map.get(exc.__class__):
-            # run unknown_error() method if the exception is not registered
-            drf_exception.data = exception_handler_instance.unknown_error()
-            return drf_exception
-        # run the specific exception handler method
-        drf_exception.data = exception_map[exc.__class__]()
+        # run the specific exception handler method for the first matching class
+        for method_name, exc_cls in _HANDLER_METHODS:
+            if isinstance(exc, exc_cls):
+                drf_exception.data = getattr(exception_handler_instance, method_name)()
+                return drf_exception
+        # run unknown_error() method if the exception is not registered
+        drf_exception.data = exception_handler_instance.unknown_error()
         return drf_exception
     # if any issue occurs run internal_server_error() method
     return Response(
@@ -194,21 +200,17 @@ def flatten(data):
     Returns:
     dict: The flattened dictionary.
     """
+    # Iterative walk with an explicit stack: no recursive call frames and no
+    # temporary per-level dicts, regardless of how deeply DRF nests the errors.
     flattened_data = {}
-    for key, value in data.items():
+    stack = [(None, data)]
+    while stack:
+        key, value = stack.pop()
         if isinstance(value, dict):
-            # Recursively flatten any nested dictionaries.
-            flattened_value = flatten(value)
-            for nested_key, nested_value in flattened_value.items():
-                flattened_data[nested_key] = nested_value
+            stack.extend(value.items())
         elif isinstance(value, list):
-            # Flatten any nested lists of dictionaries.
             for item in value:
-                if isinstance(item, dict):
-                    flattened_item = flatten(item)
-                    for nested_key, nested_value in flattened_item.items():
-                        flattened_data[nested_key] = nested_value
-                elif isinstance(item, ErrorDetail):
-                    # If the item is an ErrorDetail object, extract the error message.
-                    flattened_data[key] = item
+                stack.append((key, item))
+        elif isinstance(value, ErrorDetail):
+            flattened_data[key] = value
     return flattened_data
\ No newline at end of file
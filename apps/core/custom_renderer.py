@@ -1,6 +1,11 @@
 from rest_framework import exceptions
 from rest_framework.renderers import JSONRenderer
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 class CustomRenderer(JSONRenderer):
     media_type = "application/json"
@@ -15,4 +20,11 @@ class CustomRenderer(JSONRenderer):
             raise exceptions.ValidationError(
                 {"message": "Cannot find all keys on payload"}
             )
-        return super().render(data, accepted_media_type, renderer_context)
\ No newline at end of file
+        if orjson is not None:
+            # C-extension encoder: several times faster than the stdlib
+            # json path for dict/list payloads, and it handles datetimes
+            # natively. default=str covers the stragglers (Decimal, lazy
+            # strings); stdlib rendering remains the fallback when orjson
+            # isn't installed.
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+        return super().render(data, accepted_media_type, renderer_context)
@@ -0,0 +1,58 @@
+from apps.core.utils import optimize_queryset
+
+
+class AutoPrefetchMixin:
+    """
+    Derive select_related/prefetch_related for a view from its serializer.
+
+    Views declare their raw filter in get_base_queryset(); the mixin runs it
+    through optimize_queryset so the serializer's declared fields — not a
+    hand-maintained list in the view — decide which relations get joined or
+    batched. Adding or removing a nested serializer field can then never
+    regress into an N+1 without the fix travelling along automatically.
+
+    Class attributes:
+        auto_only_fields: Optional column names passed to .only() to trim
+            the SELECT list.
+        auto_prefetch_extra: Extra Prefetch objects (or lookup strings) for
+            relations optimize_queryset cannot see, e.g. ones consumed by
+            SerializerMethodFields.
+    """
+
+    auto_only_fields = None
+    auto_prefetch_extra = ()
+
+    def get_base_queryset(self, request):
+        """
+        Return the unoptimized queryset for this view.
+
+        Args:
+            request: HTTP request object.
+
+        Returns:
+            QuerySet: Filtered, but without select/prefetch decoration.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must define get_base_queryset()."
+        )
+
+    def get_queryset(self, request):
+        """
+        Return get_base_queryset() decorated from the serializer's shape.
+
+        Args:
+            request: HTTP request object.
+
+        Returns:
+            QuerySet: Queryset with serializer-derived select_related /
+            prefetch_related plus any declared extras applied.
+        """
+        queryset = optimize_queryset(
+            self.get_base_queryset(request),
+            self.serializer_class,
+        )
+        if self.auto_only_fields:
+            queryset = queryset.only(*self.auto_only_fields)
+        if self.auto_prefetch_extra:
+            queryset = queryset.prefetch_related(*self.auto_prefetch_extra)
+        return queryset
@@ -1,6 +1,6 @@
 from rest_framework import status
 from rest_framework.exceptions import NotFound
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
 
 
@@ -16,14 +16,19 @@ class CustomPagination(PageNumberPagination):
     page_query_param = "page"
     total_count = 0
 
-    def get_paginated_response(self, data):
+    def get_paginated_response(self, data, message="Data fetched successfully."):
+        # The response envelope is built here once; views return this Response
+        # directly instead of unwrapping .data and re-wrapping it.
         return Response(
             {
-                "count": self.page.paginator.count,
-                "page_count": self.page.paginator.num_pages,
-                "next": self.get_next_link(),
-                "previous": self.get_previous_link(),
-                "results": data,
+                "message": message,
+                "data": {
+                    "count": self.page.paginator.count,
+                    "page_count": self.page.paginator.num_pages,
+                    "next": self.get_next_link(),
+                    "previous": self.get_previous_link(),
+                    "results": data,
+                },
             }
         )
 
@@ -53,4 +58,32 @@ class CustomPagination(PageNumberPagination):
             "previous": "",
             "results": serialized_data,
         }
-        return paginated_data
\ No newline at end of file
+        return paginated_data
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Keyset (cursor) pagination ordered on (-created_at, -id).
+
+    OFFSET pagination scans and discards `offset` rows, so deep pages over a
+    large table degrade linearly. A cursor turns every page into an index
+    seek on the composite ordering key, and no COUNT(*) is ever issued.
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
+
+    def get_paginated_response(self, data, message="Data fetched successfully."):
+        return Response(
+            {
+                "message": message,
+                "data": {
+                    "next": self.get_next_link(),
+                    "previous": self.get_previous_link(),
+                    "results": data,
+                },
+            }
+        )
+
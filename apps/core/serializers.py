@@ -0,0 +1,24 @@
+import copy
+
+
+class SerializerCacheMixin:
+    """
+    Memoize DRF's get_fields() per serializer class.
+
+    DRF rebuilds every Field instance from scratch each time a serializer is
+    instantiated, which list endpoints pay once per row for nested
+    serializers. Cache the constructed (unbound) fields on the class and hand
+    each instance deep copies — DRF fields implement __deepcopy__ as a cheap
+    re-construction from their original arguments, which is much lighter than
+    re-running the full model introspection.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        fields = SerializerCacheMixin._fields_cache.get(cls)
+        if fields is None:
+            fields = super().get_fields()
+            SerializerCacheMixin._fields_cache[cls] = fields
+        return {name: copy.deepcopy(field) for name, field in fields.items()}
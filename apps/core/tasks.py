@@ -1,7 +1,7 @@
 from celery import shared_task
 
+from django.db.models import Count
 from django.utils import timezone
-from django.contrib.auth import get_user_model
 
 from apps.notifications.models import Notification
 
@@ -11,33 +11,40 @@ def send_weekly_summary() -> None:
     Celery task to send a weekly summary of unread notifications to users.
 
     This task performs the following:
-    - Iterates over all users.
-    - Fetches unread notifications created within the last 7 days.
-    - If such notifications exist, creates a new in-app notification
-      summarizing the count of unread items.
+    - Aggregates unread notifications created within the last 7 days per recipient.
+    - Creates one in-app notification per recipient summarizing the count of
+      unread items, inserted in bulk batches.
 
     Returns:
         None
-    """
-    User = get_user_model()
-    users = User.objects.all()
-
-    for user in users:
-        last_week = timezone.now() - timezone.timedelta(days=7)
-        recent_notifications = Notification.objects.filter(
-            recipient=user,
-            created_at__gte=last_week,
-            is_read=False
-        )
 
-        if recent_notifications.exists():
-            message = f"You have {recent_notifications.count()} unread notifications from this week."
-
-            Notification.objects.create(
-                recipient=user,
-                message=message,
+    Notes:
+        - The aggregation is streamed with iterator(chunk_size=...) and flushed
+          in fixed-size batches so memory stays bounded however many recipients
+          had activity this week.
+    """
+    last_week = timezone.now() - timezone.timedelta(days=7)
+    counts = (
+        Notification.objects
+        .filter(created_at__gte=last_week, is_read=False)
+        .values('recipient_id')
+        .annotate(c=Count('id'))
+    )
+
+    batch = []
+    for row in counts.iterator(chunk_size=2000):
+        batch.append(
+            Notification(
+                recipient_id=row['recipient_id'],
+                message=f"You have {row['c']} unread notifications from this week.",
                 in_app_status=True,
                 email_status=False,
                 sms_status=False,
                 is_read=False
             )
+        )
+        if len(batch) >= 1000:
+            Notification.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        Notification.objects.bulk_create(batch)
@@ -0,0 +1,84 @@
+import logging
+
+import redis
+
+from django.conf import settings
+
+from rest_framework.throttling import AnonRateThrottle, ScopedRateThrottle, UserRateThrottle
+
+logger = logging.getLogger(__name__)
+
+_redis_client = None
+
+def _get_client() -> redis.Redis:
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(settings.CACHES["default"]["LOCATION"])
+    return _redis_client
+
+
+class RedisFixedWindowMixin:
+    """
+    Fixed-window rate limiting backed by a pipelined Redis INCR/EXPIRE.
+
+    DRF's SimpleRateThrottle fetches the full request-history list from the
+    cache, mutates it in Python, and writes it back — two round-trips with a
+    payload that grows with the rate. A pipelined INCR + TTL is a single
+    round-trip against an 8-byte counter; the expiry is armed once when the
+    window opens and never refreshed, so every window closes on schedule.
+    """
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        try:
+            pipe = _get_client().pipeline()
+            pipe.incr(self.key)
+            pipe.ttl(self.key)
+            count, ttl = pipe.execute()
+            if count == 1 or ttl == -1:
+                # First hit of a fresh window — or a key orphaned without a
+                # TTL by an earlier failure between INCR and EXPIRE. Arming
+                # the expiry only here keeps later hits (including rejected
+                # ones) from pushing the window open forever.
+                _get_client().expire(self.key, int(self.duration))
+        except redis.RedisError:
+            # An unavailable throttle backend shouldn't lock users out.
+            logger.warning("Throttle backend unavailable; allowing request.")
+            return True
+
+        return count <= self.num_requests
+
+    def wait(self):
+        try:
+            ttl = _get_client().ttl(self.key)
+            if ttl and ttl > 0:
+                return ttl
+        except redis.RedisError:
+            pass
+        return self.duration
+
+
+class RedisAnonRateThrottle(RedisFixedWindowMixin, AnonRateThrottle):
+    pass
+
+
+class RedisUserRateThrottle(RedisFixedWindowMixin, UserRateThrottle):
+    pass
+
+
+class RedisScopedRateThrottle(RedisFixedWindowMixin, ScopedRateThrottle):
+    def allow_request(self, request, view):
+        # Resolve the scope and rate exactly as ScopedRateThrottle does, then
+        # run the fixed-window check instead of the history-list bookkeeping.
+        self.scope = getattr(view, self.scope_attr, None)
+        if not self.scope:
+            return True
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        return RedisFixedWindowMixin.allow_request(self, request, view)
@@ -1,11 +1,65 @@
-from rest_framework import exceptions
+from django.core.exceptions import FieldDoesNotExist
 
-def get_or_not_found(qs, **kwargs):
+from rest_framework import exceptions, serializers
+
+def optimize_queryset(qs, serializer_class):
+    """
+    Apply select_related/prefetch_related derived from a serializer's fields.
+
+    Args:
+        qs (QuerySet): The base queryset the view is about to serialize
+        serializer_class: The serializer the view renders the queryset with
+
+    Returns:
+        QuerySet: The queryset with the joins the serializer actually needs
+
+    Notes:
+        - Forward FK/one-to-one paths become select_related; many-valued
+          relations become prefetch_related.
+        - PrimaryKeyRelatedField reads the `<fk>_id` column directly, so it
+          never forces a join.
+        - Keeping the serializer as the source of truth means adding or
+          removing nested fields can't silently reintroduce an N+1.
+    """
+    select_paths = set()
+    prefetch_paths = set()
+    for name, field in serializer_class().fields.items():
+        source = field.source or name
+        if source == "*" or isinstance(field, serializers.PrimaryKeyRelatedField):
+            continue
+        model = qs.model
+        relation_parts = []
+        many = False
+        for part in source.split("."):
+            try:
+                model_field = model._meta.get_field(part)
+            except FieldDoesNotExist:
+                break
+            if not model_field.is_relation:
+                break
+            relation_parts.append(part)
+            if model_field.many_to_many or model_field.one_to_many:
+                many = True
+                break
+            model = model_field.related_model
+        if not relation_parts:
+            continue
+        path = "__".join(relation_parts)
+        (prefetch_paths if many else select_paths).add(path)
+    if select_paths:
+        qs = qs.select_related(*select_paths)
+    if prefetch_paths:
+        qs = qs.prefetch_related(*prefetch_paths)
+    return qs
+
+def get_or_not_found(qs, *, fields=None, **kwargs):
     """
     Retrieve an object from the queryset or raise a 404 Not Found exception.
 
     Args:
         qs (QuerySet): A Django queryset from which to retrieve an object
+        fields (tuple | None): Optional field names passed to only() so the
+            SELECT fetches just the columns the caller actually uses
         **kwargs: The filters to apply when querying the queryset
 
     Returns:
@@ -15,6 +69,8 @@ def get_or_not_found(qs, **kwargs):
         exceptions.NotFound: If the object is not found in the queryset
     """
 
+    if fields:
+        qs = qs.only(*fields)
     try:
         return qs.get(**kwargs)
     except qs.model.DoesNotExist:
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models.functions import Substr
 from apps.notifications.models import (
     Thread,
     Comment,
@@ -13,6 +14,7 @@ class ThreadAdmin(admin.ModelAdmin):
     list_filter = ("created_by", "created_at")
     search_fields = ("title",)
     readonly_fields = ("created_at", "updated_at", "created_by", "updated_by")
+    list_select_related = ("created_by", "updated_by")
 
 
 @admin.register(Comment)
@@ -21,9 +23,18 @@ class CommentAdmin(admin.ModelAdmin):
     list_filter = ("user", "thread", "created_at")
     search_fields = ("content", "user__email", "thread__title")
     readonly_fields = ("created_at", "updated_at", "created_by", "updated_by")
+    list_select_related = ("user", "thread")
+
+    def get_queryset(self, request):
+        # Truncate in the DB so the changelist never transfers full bodies;
+        # the defer keeps the source column itself out of the SELECT list.
+        return super().get_queryset(request).annotate(
+            _short_content=Substr("content", 1, 51)
+        ).defer("content")
 
     def short_content(self, obj):
-        return obj.content[:50] + "..." if len(obj.content) > 50 else obj.content
+        text = obj._short_content
+        return text[:50] + "..." if len(text) > 50 else text
     short_content.short_description = "Content"
 
 
@@ -33,6 +44,7 @@ class ThreadSubscriptionAdmin(admin.ModelAdmin):
     list_filter = ("user", "thread")
     search_fields = ("user__email", "thread__title")
     readonly_fields = ("created_at", "updated_at", "created_by", "updated_by")
+    list_select_related = ("user", "thread")
 
 
 @admin.register(NotificationPreference)
@@ -41,6 +53,7 @@ class NotificationPreferenceAdmin(admin.ModelAdmin):
     list_filter = ("in_app", "email", "sms")
     search_fields = ("user__email",)
     readonly_fields = ("created_at", "updated_at", "created_by", "updated_by")
+    list_select_related = ("user",)
 
 
 @admin.register(Notification)
@@ -52,10 +65,19 @@ class NotificationAdmin(admin.ModelAdmin):
     list_filter = ("in_app_status", "email_status", "sms_status", "is_read", "created_at")
     search_fields = ("recipient__email", "message", "comment__content")
     readonly_fields = (
-        "created_at", "updated_at", "created_by", "updated_by", 
+        "created_at", "updated_at", "created_by", "updated_by",
         "email_task_id", "sms_task_id"
     )
+    list_select_related = ("recipient",)
+
+    def get_queryset(self, request):
+        # Truncate in the DB so the changelist never transfers full bodies;
+        # the defer keeps the source column itself out of the SELECT list.
+        return super().get_queryset(request).annotate(
+            _message_snippet=Substr("message", 1, 51)
+        ).defer("message")
 
     def message_snippet(self, obj):
-        return obj.message[:50] + "..." if len(obj.message) > 50 else obj.message
+        text = obj._message_snippet
+        return text[:50] + "..." if len(text) > 50 else text
     message_snippet.short_description = "Message"
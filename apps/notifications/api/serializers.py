@@ -1,11 +1,17 @@
 from typing import Any, Dict
 
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Prefetch
+from django.utils import timezone
+
 from rest_framework import serializers
 
+from apps.core.serializers import SerializerCacheMixin
 from apps.notifications.models import Comment, Notification, NotificationPreference, Thread, ThreadSubscription
 
 
-class NotificationPreferenceSerailizer(serializers.ModelSerializer):
+class NotificationPreferenceSerailizer(SerializerCacheMixin, serializers.ModelSerializer):
     """
     Serializer for user's notification preferences.
     Includes in-app, email, and SMS preferences.
@@ -21,9 +27,38 @@ class NotificationPreferenceSerailizer(serializers.ModelSerializer):
             "email",
             "sms"
         ]
-    
 
-class CommentSerializer(serializers.ModelSerializer):
+    def update(self, instance: NotificationPreference, validated_data: Dict[str, Any]) -> NotificationPreference:
+        """
+        Persist a partial preference update with a targeted UPDATE.
+
+        Args:
+            instance (NotificationPreference): Preference row being patched.
+            validated_data (dict): Only the fields present in the PATCH body.
+
+        Returns:
+            NotificationPreference: The instance with updated attributes.
+
+        Notes:
+            - QuerySet.update writes only the submitted columns and skips the
+              full-row save() plus its signal machinery; the post_save cache
+              invalidation is triggered explicitly instead.
+            - The in-memory instance is patched by hand, so no refetch is
+              needed to build the response.
+        """
+        if validated_data:
+            NotificationPreference.objects.filter(pk=instance.pk).update(**validated_data)
+            for field, value in validated_data.items():
+                setattr(instance, field, value)
+            from apps.notifications.services import preference_cache_key, preference_response_cache_key
+            cache.delete_many([
+                preference_cache_key(instance.user_id),
+                preference_response_cache_key(instance.user_id),
+            ])
+        return instance
+
+
+class CommentSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     """
     Serializer for comments in a thread.
     Automatically assigns the user from context.
@@ -53,7 +88,7 @@ class CommentSerializer(serializers.ModelSerializer):
         validated_data["user"] = self.context.get("user")
         return super().create(validated_data)
 
-class ThreadSerializer(serializers.ModelSerializer):
+class ThreadSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     """
     Serializer for creating threads.
     Automatically subscribes the creator to the thread.
@@ -75,59 +110,68 @@ class ThreadSerializer(serializers.ModelSerializer):
 
         Notes:
             - Automatically subscribes the creating user.
+            - Both inserts share one atomic block so a failed subscription
+              can't leave an orphaned thread.
         """
         user = self.context.get("request").user
-        thread = super().create(validated_data)
-        ThreadSubscription.objects.get_or_create(thread=thread, user=user)
-        return validated_data
+        with transaction.atomic():
+            thread = super().create(validated_data)
+            ThreadSubscription.objects.get_or_create(thread=thread, user=user)
+        return thread
 
-class ThreadSubscriptionSerializer(serializers.ModelSerializer):
+class ThreadSubscriptionSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     """
     Serializer for subscribing a user to a thread.
-    Prevents duplicate subscriptions.
+    Duplicate subscriptions resolve to the existing row.
     """
     
     class Meta:
         model = ThreadSubscription
         fields = ['thread']
-    
-    def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Ensure a user doesn't subscribe to the same thread multiple times.
-
-        Args:
-            attrs (dict): Validated subscription data.
-
-        Returns:
-            dict: Cleaned attributes.
 
-        Raises:
-            ValidationError: If subscription already exists.
-        """
-        if ThreadSubscription.objects.filter(thread = attrs.get("thread"),user=self.context.get("user")).exists():
-            raise serializers.ValidationError({"Thread Subscription":"Thread Subscription already exists for this user."})
-        return super().validate(attrs)
-    
     def create(self, validated_data: Dict[str, Any]) -> ThreadSubscription:
         """
-        Create a new thread subscription for the user.
+        Create a thread subscription for the user, idempotently.
 
         Args:
             validated_data (dict): Validated subscription data.
 
         Returns:
-            ThreadSubscription: Created subscription instance.
+            ThreadSubscription: Created (or already existing) subscription instance.
+
+        Notes:
+            - ignore_conflicts makes Django emit a single
+              INSERT ... ON CONFLICT DO NOTHING against the (thread, user)
+              unique constraint: one round-trip with no SELECT probe and no
+              Python-level race handling. Duplicate subscribes are no-ops.
+            - No refetch on conflict: the response echoes only the thread
+              id, which the unsaved instance already carries.
         """
-        validated_data['user'] = self.context.get('user')
-        return super().create(validated_data)
+        subscription = ThreadSubscription(
+            thread=validated_data['thread'],
+            user=self.context.get('user'),
+        )
+        ThreadSubscription.objects.bulk_create([subscription], ignore_conflicts=True)
+        return subscription
     
-class NotificationSerializer(serializers.ModelSerializer):
+# Batches the comment (with its thread) for a whole page in one query and
+# binds it to a plain attribute, so serialization reads _comment_cached
+# directly instead of walking the FK descriptor per row.
+COMMENT_PREFETCH = Prefetch(
+    'comment',
+    queryset=Comment.objects.select_related('thread').only(
+        'id', 'content', 'created_at', 'user', 'thread__id', 'thread__title'
+    ),
+    to_attr='_comment_cached',
+)
+
+class NotificationSerializer(SerializerCacheMixin, serializers.ModelSerializer):
     """
     Serializer for notifications.
     Includes nested comment and thread data.
     """
-    comment = CommentSerializer(allow_null=True)
-    thread = ThreadSerializer(source='comment.thread', allow_null=True, read_only=True)
+    comment = serializers.SerializerMethodField()
+    thread = serializers.SerializerMethodField()
 
     class Meta:
         model = Notification
@@ -136,6 +180,37 @@ class NotificationSerializer(serializers.ModelSerializer):
             'in_app_status', 'email_status', 'sms_status'
         ]
 
+    def _cached_comment(self, obj: Notification) -> Comment | None:
+        # getattr with a default would evaluate obj.comment eagerly — one
+        # lazy SELECT per row even when the prefetch populated the cache —
+        # so the descriptor is only touched when the attribute is absent.
+        try:
+            return obj._comment_cached
+        except AttributeError:
+            return obj.comment
+
+    def get_comment(self, obj: Notification) -> Dict[str, Any] | None:
+        comment = self._cached_comment(obj)
+        if comment is None:
+            return None
+        return CommentSerializer(comment, context=self.context).data
+
+    def get_thread(self, obj: Notification) -> Dict[str, Any] | None:
+        comment = self._cached_comment(obj)
+        if comment is None:
+            return None
+        # Many notifications on one page usually point at the same few
+        # threads; memoize the rendered dict per thread for this request so
+        # the cost is O(unique threads), not O(rows). The context dict is
+        # shared across rows by the ListSerializer, which scopes the memo to
+        # a single serialization pass.
+        memo = self.context.setdefault('_thread_repr_cache', {})
+        thread_repr = memo.get(comment.thread_id)
+        if thread_repr is None:
+            thread_repr = ThreadSerializer(comment.thread, context=self.context).data
+            memo[comment.thread_id] = thread_repr
+        return thread_repr
+
 class MarkReadSerializer(serializers.Serializer):
     """
     Serializer to mark multiple notifications as read.
@@ -148,33 +223,20 @@ class MarkReadSerializer(serializers.Serializer):
     
     def validate_notification_ids(self, value: list[int]) -> list[int]:
         """
-        Ensure provided notification IDs belong to the user.
+        De-duplicate the provided notification IDs.
 
         Args:
             value (list[int]): List of notification IDs.
 
         Returns:
-            list[int]: Valid notification IDs.
+            list[int]: Unique notification IDs.
 
-        Raises:
-            ValidationError: If any ID does not belong to the user.
+        Notes:
+            - Ownership is enforced by the UPDATE in create(), so no
+              pre-validation SELECT is issued here.
         """
+        return list(set(value))
 
-        user = self.context['user']
-        valid_ids = set(
-            Notification.objects.filter(
-                recipient=user,
-                id__in=value
-            ).values_list('id', flat=True)
-        )
-        
-        invalid_ids = set(value) - valid_ids
-        if invalid_ids:
-            raise serializers.ValidationError(
-                f"Notifications not found or not owned by you: {invalid_ids}"
-            )
-        return value
-    
     def create(self, validated_data: Dict[str, Any]) -> int:
         """
         Mark provided notifications as read.
@@ -184,10 +246,37 @@ class MarkReadSerializer(serializers.Serializer):
 
         Returns:
             int: Count of updated notification records.
+
+        Raises:
+            ValidationError: If any ID does not belong to the user.
+
+        Notes:
+            - The ownership filter lives on the UPDATE itself, so the common
+              case (all IDs valid) costs a single statement. Only a count
+              mismatch pays for the extra lookup that names the bad IDs.
+            - The bad-ID lookup runs the set difference in Postgres via
+              EXCEPT, so only the offending IDs come back over the wire
+              instead of every valid one.
         """
         notification_ids = validated_data['notification_ids']
+        user = self.context.get("user")
+        # QuerySet.update skips auto_now, so updated_at is set explicitly to
+        # keep the audit column honest within the same single statement.
         updated = Notification.objects.filter(
             id__in=notification_ids,
-            recipient=self.context.get("user")
-        ).update(is_read=True)
+            recipient=user
+        ).update(is_read=True, updated_at=timezone.now())
+        if updated != len(notification_ids):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT unnest(%s::bigint[]) "
+                    "EXCEPT "
+                    "SELECT id FROM notification "
+                    "WHERE recipient_id = %s AND id = ANY(%s::bigint[])",
+                    [notification_ids, user.id, notification_ids],
+                )
+                invalid_ids = {row[0] for row in cursor.fetchall()}
+            raise serializers.ValidationError(
+                f"Notifications not found or not owned by you: {invalid_ids}"
+            )
         return updated
\ No newline at end of file
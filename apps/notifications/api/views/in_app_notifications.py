@@ -3,28 +3,97 @@ from rest_framework.views import APIView
 from rest_framework import serializers, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.throttling import ScopedRateThrottle
+from apps.core.throttling import RedisScopedRateThrottle
 
 
 from drf_spectacular.utils import extend_schema, inline_serializer,OpenApiParameter
 
-from apps.core.pagination import CustomPagination
-from apps.notifications.api.serializers import MarkReadSerializer, NotificationSerializer
+from apps.core.mixins import AutoPrefetchMixin
+from apps.core.pagination import KeysetPagination
+from apps.notifications.api.serializers import COMMENT_PREFETCH, MarkReadSerializer, NotificationSerializer
 from apps.notifications.models import Notification
 
 logger = logging.getLogger(__name__)
 
-class UnreadNotificationsAPIView(APIView):
+# Columns NotificationSerializer actually renders; the task ids, audit
+# columns and the recipient FK stay out of the SELECT list.
+NOTIFICATION_LIST_FIELDS = (
+    'id', 'message', 'created_at', 'is_read',
+    'in_app_status', 'email_status', 'sms_status', 'comment',
+)
+
+# Formats raw datetimes exactly like the serializer path's DateTimeField
+# ("Z"-suffixed), so the dict rows stay byte-identical on the wire.
+DATETIME_FIELD = serializers.DateTimeField()
+
+# Flat .values() projection covering the same output, including the nested
+# comment/thread data via JOINs, for the dict-based fast path below.
+NOTIFICATION_VALUES_FIELDS = (
+    'id', 'message', 'created_at', 'is_read',
+    'in_app_status', 'email_status', 'sms_status',
+    'comment__id', 'comment__content', 'comment__created_at',
+    'comment__user_id', 'comment__thread__id', 'comment__thread__title',
+)
+
+def shape_notification_row(row):
+    """
+    Reshape one flat .values() row into the NotificationSerializer layout.
+
+    Args:
+        row (dict): Flat mapping produced by NOTIFICATION_VALUES_FIELDS.
+
+    Returns:
+        dict: Nested representation matching the serializer output, so both
+        paths stay wire-compatible.
+
+    Notes:
+        - .values() rows come straight out of the ORM's C-level row mapping;
+          no DRF Field objects are built per row, which is where most of the
+          CPU goes on large pages.
+    """
+    if row['comment__id'] is None:
+        comment = None
+        thread = None
+    else:
+        comment = {
+            'content': row['comment__content'],
+            'thread': row['comment__thread__id'],
+            'user': row['comment__user_id'],
+            'created_at': DATETIME_FIELD.to_representation(row['comment__created_at']),
+        }
+        thread = {
+            'id': row['comment__thread__id'],
+            'title': row['comment__thread__title'],
+        }
+    return {
+        'id': row['id'],
+        'comment': comment,
+        'thread': thread,
+        'message': row['message'],
+        'created_at': DATETIME_FIELD.to_representation(row['created_at']),
+        'is_read': row['is_read'],
+        'in_app_status': row['in_app_status'],
+        'email_status': row['email_status'],
+        'sms_status': row['sms_status'],
+    }
+
+class UnreadNotificationsAPIView(AutoPrefetchMixin, APIView):
     """
     API view to fetch unread notifications for the authenticated user.
     """
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]
-    pagination_class = CustomPagination
-    throttle_classes = [ScopedRateThrottle]
+    # Cursor pagination: no COUNT(*) per request, and every page is an
+    # index seek on (-created_at, -id) regardless of unread volume.
+    pagination_class = KeysetPagination
+    throttle_classes = [RedisScopedRateThrottle]
     throttle_scope = 'unread_notifications'
-    
-    def get_queryset(self,request):
+    auto_only_fields = NOTIFICATION_LIST_FIELDS
+    # The comment/thread data is consumed by SerializerMethodFields, which
+    # AutoPrefetchMixin cannot introspect, so it is declared here once.
+    auto_prefetch_extra = (COMMENT_PREFETCH,)
+
+    def get_base_queryset(self, request):
         """
         Fetch unread notifications for the authenticated user.
 
@@ -34,11 +103,8 @@ class UnreadNotificationsAPIView(APIView):
         Returns:
             QuerySet of unread notifications.
         """
-        return Notification.objects.filter(
-            recipient=request.user,
-            is_read=False
-        ).select_related('comment', 'comment__thread', 'comment__user')
-    
+        return Notification.objects.filter(recipient=request.user, is_read=False)
+
     @extend_schema(
         operation_id="Unread Notification fetch Api.",
         summary="SN-NF-01",
@@ -49,7 +115,7 @@ class UnreadNotificationsAPIView(APIView):
         tags=["Notification",],
         parameters=[
             OpenApiParameter(
-                name="page",
+                name="cursor",
                 type=str,
                 location=OpenApiParameter.QUERY,
             ),
@@ -87,18 +153,15 @@ class UnreadNotificationsAPIView(APIView):
         
         if page is not None:
             serializer = self.serializer_class(page, many=True)
-            paginated_response =paginator.get_paginated_response(serializer.data)
-            paginated_data = paginated_response.data
             logger.info("Unread notifications fetched for user %s", request.user.id)
-            return Response(
-                {
-                    "message": "Unread Notification fetched successfully.",
-                    "data": paginated_data,
-                },
-                status=status.HTTP_200_OK,
+            return paginator.get_paginated_response(
+                serializer.data,
+                message="Unread Notification fetched successfully.",
             )
         
-        serializer = self.serializer_class(queryset, many=True)
+        # Unpaginated fallback: stream rows from the DB cursor in chunks so
+        # the ORM never materializes the whole result set at once.
+        serializer = self.serializer_class(queryset.iterator(chunk_size=200), many=True)
         logger.info("Unread notifications (no pagination) fetched for user %s", request.user.id)
         return Response(
                 {
@@ -114,7 +177,7 @@ class MarkAsReadAPIView(APIView):
     """
     serializer_class = MarkReadSerializer
     permission_classes = [IsAuthenticated]
-    throttle_classes = [ScopedRateThrottle]
+    throttle_classes = [RedisScopedRateThrottle]
     throttle_scope = 'mark_notifications_read'
     
     @extend_schema(
@@ -184,8 +247,8 @@ class NotificationHistoryAPIView(APIView):
     """
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]
-    pagination_class = CustomPagination
-    throttle_classes = [ScopedRateThrottle]
+    pagination_class = KeysetPagination
+    throttle_classes = [RedisScopedRateThrottle]
     throttle_scope = 'notification_history'
     
     def get_queryset(self,request):
@@ -196,15 +259,17 @@ class NotificationHistoryAPIView(APIView):
             request: HTTP request object.
 
         Returns:
-            QuerySet of all notifications.
+            QuerySet of flat notification dicts (see NOTIFICATION_VALUES_FIELDS).
         """
+        # History is the highest-volume list, so it takes the dict fast
+        # path: one JOINed SELECT into plain dicts, reshaped by
+        # shape_notification_row, with no serializer instantiation per row.
+        # Ordering comes from KeysetPagination's (-created_at, -id) cursor key.
         return Notification.objects.filter(
             recipient=request.user
-        ).select_related(
-            'comment', 'comment__thread', 'comment__user'
-        ).order_by('-created_at')
-        
-    
+        ).values(*NOTIFICATION_VALUES_FIELDS)
+
+
     @extend_schema(
         operation_id="Notification History fetch Api.",
         summary="SN-NF-03",
@@ -215,7 +280,7 @@ class NotificationHistoryAPIView(APIView):
         tags=["Notification",],
         parameters=[
             OpenApiParameter(
-                name="page",
+                name="cursor",
                 type=str,
                 location=OpenApiParameter.QUERY,
             ),
@@ -250,26 +315,23 @@ class NotificationHistoryAPIView(APIView):
         queryset = self.get_queryset(request)
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(queryset, request)
-        
+
         if page is not None:
-            serializer = self.serializer_class(page, many=True)
-            paginated_response =paginator.get_paginated_response(serializer.data)
-            paginated_data = paginated_response.data
+            data = [shape_notification_row(row) for row in page]
             logger.info("Notification history fetched for user %s (paginated)", request.user.id)
-            return Response(
-                {
-                    "message": "Notifications fetched successfully.",
-                    "data": paginated_data,
-                },
-                status=status.HTTP_200_OK,
+            return paginator.get_paginated_response(
+                data,
+                message="Notifications fetched successfully.",
             )
-        
-        serializer = self.serializer_class(queryset, many=True)
+
+        # Unpaginated fallback: chunked cursor keeps the working set bounded
+        # even for users with very large histories.
+        data = [shape_notification_row(row) for row in queryset.iterator(chunk_size=200)]
         logger.info("Notification history fetched for user %s (no pagination)", request.user.id)
         return Response(
                 {
                     "message": "Notifications fetched successfully.",
-                    "data": serializer.data,
+                    "data": data,
                 },
                 status=status.HTTP_200_OK,
             )
@@ -1,18 +1,23 @@
 import logging 
 
+from django.core.cache import cache
+
 from rest_framework.views import APIView
 from rest_framework import serializers, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.throttling import ScopedRateThrottle
+from apps.core.throttling import RedisScopedRateThrottle
 
 
 from drf_spectacular.utils import extend_schema, inline_serializer
 
-from apps.accounts.models import User
 from apps.core.utils import get_or_not_found
 from apps.notifications.api.serializers import NotificationPreferenceSerailizer
 from apps.notifications.models import NotificationPreference
+from apps.notifications.services import (
+    PREFERENCE_RESPONSE_CACHE_TIMEOUT,
+    preference_response_cache_key,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +27,7 @@ class NotificationPreferencesView(APIView):
     """
     serializer_class = NotificationPreferenceSerailizer
     permission_classes = [IsAuthenticated]
-    throttle_classes = [ScopedRateThrottle]
+    throttle_classes = [RedisScopedRateThrottle]
 
     def get_throttles(self):
         if self.request.method == 'GET':
@@ -42,10 +47,16 @@ class NotificationPreferencesView(APIView):
             NotificationPreference: Related notification preference object.
 
         Raises:
-            Http404: If the user does not exist.
+            NotFound: If no preference row exists for the user.
         """
-        user = get_or_not_found(User.objects.all(),id=user)
-        return NotificationPreference.objects.filter(user=user).first()
+        # One JOINed query: the FK guarantees the user exists if the
+        # preference row does, so the separate User lookup is redundant.
+        # The projection keeps the wide User row out of the SELECT list.
+        return get_or_not_found(
+            NotificationPreference.objects.select_related("user"),
+            fields=("id", "in_app", "email", "sms", "user__id"),
+            user_id=user,
+        )
         
 
     @extend_schema(
@@ -121,7 +132,9 @@ class NotificationPreferencesView(APIView):
         return Response(
             {
                 "message": "Notification Preference Updated Successful",
-                "data": serializer.data,
+                # Plain dict: cheaper for the renderer (and any cache) than
+                # DRF's ReturnDict/OrderedDict output.
+                "data": dict(serializer.data),
             },
             status=status.HTTP_200_OK,
         )
@@ -157,13 +170,18 @@ class NotificationPreferencesView(APIView):
         Returns:
             Response: User’s notification preferences.
         """
-        queryset = self.get_queryset(user=kwargs.get("user_id"))
-        serializer = self.serializer_class(queryset)
-        logger.info("Notification preferences retrieved for user ID: %s", kwargs.get("user_id"))
+        user_id = kwargs.get("user_id")
+        key = preference_response_cache_key(user_id)
+        data = cache.get(key)
+        if data is None:
+            serializer = self.serializer_class(self.get_queryset(user=user_id))
+            data = dict(serializer.data)
+            cache.set(key, data, PREFERENCE_RESPONSE_CACHE_TIMEOUT)
+        logger.info("Notification preferences retrieved for user ID: %s", user_id)
         return Response(
             {
                 "message": "Notification Preferences Fetched Successful",
-                "data": serializer.data,
+                "data": data,
             },
             status=status.HTTP_200_OK,
         )
@@ -4,16 +4,26 @@ from rest_framework.views import APIView
 from rest_framework import serializers, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.throttling import UserRateThrottle,AnonRateThrottle
+from apps.core.throttling import RedisAnonRateThrottle, RedisUserRateThrottle
 
 
 from drf_spectacular.utils import extend_schema, inline_serializer
 
+from apps.core.pagination import CustomPagination
 from apps.notifications.api.serializers import ThreadSerializer, ThreadSubscriptionSerializer
 from apps.notifications.models import Thread
 
 logger = logging.getLogger(__name__)
 
+# Formats raw datetimes from the .values() rows the way DRF's DateTimeField
+# does ("Z"-suffixed), keeping the wire format consistent across endpoints.
+DATETIME_FIELD = serializers.DateTimeField()
+
+def _shape_thread_row(row):
+    row['created_at'] = DATETIME_FIELD.to_representation(row['created_at'])
+    row['updated_at'] = DATETIME_FIELD.to_representation(row['updated_at'])
+    return row
+
 class ThreadView(APIView):
     """
     API endpoint to create a new discussion thread.
@@ -21,7 +31,7 @@ class ThreadView(APIView):
     
     serializer_class= ThreadSerializer
     permission_classes = [IsAuthenticated]
-    throttle_classes = [UserRateThrottle,AnonRateThrottle]
+    throttle_classes = [RedisUserRateThrottle,RedisAnonRateThrottle]
     
     def get_queryset(self):
         return Thread.objects.all()
@@ -82,7 +92,9 @@ class ThreadView(APIView):
         return Response(
             {
                 "message": "Threads Created Successful",
-                "data": serializer.data,
+                # Plain dict: cheaper for the renderer (and any cache) than
+                # DRF's ReturnDict/OrderedDict output.
+                "data": dict(serializer.data),
             },
             status=status.HTTP_201_CREATED,
         )
@@ -94,14 +106,19 @@ class ThreadGetView(APIView):
     
     serializer_class= ThreadSerializer
     permission_classes = []
-    throttle_classes = [UserRateThrottle,AnonRateThrottle]
-    
+    pagination_class = CustomPagination
+    throttle_classes = [RedisUserRateThrottle,RedisAnonRateThrottle]
+
     def get_queryset(self):
         """
-        A method to retrieve all threads.
+        A method to retrieve all threads as flat dicts.
         """
-        return Thread.objects.all()
-    
+        # Dict fast path: .values() rows go straight into the response with
+        # no per-row model instantiation or serializer field binding.
+        return Thread.objects.values(
+            'id', 'title', 'created_at', 'updated_at', 'created_by_id'
+        )
+
     @extend_schema(
         operation_id="thread get Api.",
         summary="SN-TH-02",
@@ -133,12 +150,23 @@ class ThreadGetView(APIView):
             Response with serialized thread list.
         """
         queryset = self.get_queryset()
-        serializer = self.serializer_class(queryset,many=True)
-        logger.info(f"Fetched {len(serializer.data)} threads.")
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(queryset, request)
+
+        if page is not None:
+            data = [_shape_thread_row(row) for row in page]
+            logger.info("Fetched %d threads (paginated).", len(data))
+            return paginator.get_paginated_response(
+                data,
+                message="Threads Fetched Successful",
+            )
+
+        data = [_shape_thread_row(row) for row in queryset]
+        logger.info("Fetched %d threads.", len(data))
         return Response(
             {
                 "message": "Threads Fetched Successful",
-                "data": serializer.data,
+                "data": data,
             },
             status=status.HTTP_200_OK,
         )
@@ -150,7 +178,7 @@ class ThreadSubscriptionView(APIView):
     
     serializer_class= ThreadSubscriptionSerializer
     permission_classes = [IsAuthenticated]
-    throttle_classes = [UserRateThrottle,AnonRateThrottle]
+    throttle_classes = [RedisUserRateThrottle,RedisAnonRateThrottle]
     
     @extend_schema(
         operation_id="thread subscription Post Api.",
@@ -208,7 +236,7 @@ class ThreadSubscriptionView(APIView):
         return Response(
             {
                 "message": "Threads Subscription Created Successful",
-                "data": serializer.data,
+                "data": dict(serializer.data),
             },
             status=status.HTTP_201_CREATED,
         )
\ No newline at end of file
@@ -4,7 +4,7 @@ from rest_framework.views import APIView
 from rest_framework import serializers, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.throttling import UserRateThrottle,AnonRateThrottle
+from apps.core.throttling import RedisAnonRateThrottle, RedisUserRateThrottle
 
 from drf_spectacular.utils import extend_schema, inline_serializer
 
@@ -19,7 +19,7 @@ class CommentView(APIView):
     
     serializer_class= CommentSerializer
     permission_classes = [IsAuthenticated]
-    throttle_classes = [UserRateThrottle,AnonRateThrottle]
+    throttle_classes = [RedisUserRateThrottle,RedisAnonRateThrottle]
     
     @extend_schema(
         operation_id="Comment Post Api.",
@@ -94,7 +94,9 @@ class CommentView(APIView):
         return Response(
             {
                 "message": "Comments Created Successful",
-                "data": serializer.data,
+                # Plain dict: cheaper for the renderer (and any cache) than
+                # DRF's ReturnDict/OrderedDict output.
+                "data": dict(serializer.data),
             },
             status=status.HTTP_201_CREATED,
         )
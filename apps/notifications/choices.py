@@ -1,9 +1,17 @@
 from django.db import models
 
+# Pre-resolved string constants for hot paths: importing these skips the
+# Enum member + .value descriptor lookup that ChannelChoices.IN_APP.value
+# pays per access. The TextChoices classes stay for model choices= kwargs.
+IN_APP = 'IN_APP'
+EMAIL = 'EMAIL'
+SUCCESS = 'SUCCESS'
+FAILED = 'FAILED'
+
 class ChannelChoices(models.TextChoices):
-        IN_APP = 'IN_APP','0'
-        EMAIL = 'EMAIL','1'
+        IN_APP = IN_APP, '0'
+        EMAIL = EMAIL, '1'
 
 class StatusChoices(models.TextChoices):
-    SUCCESS = 'SUCCESS','0'
-    FAILED = 'FAILED','1'
\ No newline at end of file
+    SUCCESS = SUCCESS, '0'
+    FAILED = FAILED, '1'
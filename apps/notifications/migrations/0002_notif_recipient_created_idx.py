@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-08-29 09:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(
+                fields=['recipient', '-created_at', '-id'],
+                name='notif_recipient_created_idx',
+            ),
+        ),
+    ]
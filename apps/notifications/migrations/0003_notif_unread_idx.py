@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-08-29 09:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_notif_recipient_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(
+                fields=['recipient', 'is_read', '-created_at'],
+                name='notif_unread_idx',
+            ),
+        ),
+    ]
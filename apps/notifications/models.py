@@ -30,6 +30,10 @@ class ThreadSubscription(UserCreatedUpdatedBy):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='subscriptions')
 
     class Meta:
+        # The unique_together constraint materializes a composite B-tree on
+        # (thread_id, user_id); its thread_id prefix already serves the
+        # thread-scoped fan-out lookups, so no separate thread index is
+        # declared.
         unique_together = ('thread', 'user')
         db_table = "thread_subscription"
 
@@ -64,4 +68,17 @@ class Notification(UserCreatedUpdatedBy):
         return f"{self.channel} notification to {self.recipient}"
 
     class Meta:
-        db_table = "notification"
\ No newline at end of file
+        db_table = "notification"
+        indexes = [
+            # Backs the keyset-paginated history endpoint: one index seek per page.
+            models.Index(
+                fields=["recipient", "-created_at", "-id"],
+                name="notif_recipient_created_idx",
+            ),
+            # Backs the unread-list predicate (recipient, is_read) with the
+            # cursor ordering appended.
+            models.Index(
+                fields=["recipient", "is_read", "-created_at"],
+                name="notif_unread_idx",
+            ),
+        ]
\ No newline at end of file
@@ -2,17 +2,16 @@ import logging
 
 from celery import shared_task
 
-from apps.accounts.models import User
 from .models import Notification
 
 logger = logging.getLogger(__name__)
 
-def send_mock_email(user: User, subject: str, message: str) -> bool:
+def send_mock_email(email: str, subject: str, message: str) -> bool:
     """
-    Simulate sending an email notification to a user.
+    Simulate sending an email notification to an address.
 
     Args:
-        user: User instance to whom the email will be sent.
+        email: Address the email will be sent to.
         subject: Subject line of the email.
         message: Body content of the email.
 
@@ -23,18 +22,18 @@ def send_mock_email(user: User, subject: str, message: str) -> bool:
         Info on sending attempt and errors if any.
     """
     try:
-        logger.info(f"Mock email to {user.email}: {subject}")
+        logger.info(f"Mock email to {email}: {subject}")
         return True
     except Exception as e:
-        logger.error(f"Email failed to {user.email}: {str(e)}")
+        logger.error(f"Email failed to {email}: {str(e)}")
         return False
 
-def send_mock_sms(user: User, message: str) -> bool:
+def send_mock_sms(email: str, message: str) -> bool:
     """
     Simulate sending an SMS notification to a user.
 
     Args:
-        user: User instance to whom the SMS will be sent.
+        email: Address identifying the user the SMS goes to.
         message: SMS content (typically limited to 160 chars).
 
     Returns:
@@ -44,10 +43,10 @@ def send_mock_sms(user: User, message: str) -> bool:
         Info on sending attempt and errors if any.
     """
     try:
-        logger.info(f"Mock SMS to {user.email}: {message}")
+        logger.info(f"Mock SMS to {email}: {message}")
         return True
     except Exception as e:
-        logger.error(f"SMS failed to {user.email}: {str(e)}")
+        logger.error(f"SMS failed to {email}: {str(e)}")
         return False
     
 @shared_task(
@@ -71,16 +70,22 @@ def send_email_notification(notification_id: int, subject: str, message: str) ->
     Retries:
         Retries up to 3 times with exponential backoff on exceptions.
     """
-    notification = Notification.objects.get(id=notification_id)
+    # Only the recipient's address is needed to send; a values_list fetch
+    # skips model instantiation, and the status lands via one UPDATE with
+    # no row re-fetch.
+    recipient_email = Notification.objects.filter(
+        id=notification_id
+    ).values_list('recipient__email', flat=True).get()
     success = send_mock_email(
-        notification.recipient,
+        recipient_email,
         subject,
         message
     )
-    notification.email_status = success
-    notification.email_task_id = None
-    notification.save(update_fields=['email_status', 'email_task_id'])
-    
+    Notification.objects.filter(id=notification_id).update(
+        email_status=success,
+        email_task_id=None,
+    )
+
 
 @shared_task(
     autoretry_for=(Exception,),
@@ -102,11 +107,15 @@ def send_sms_notification(notification_id: int, message: str) -> None:
     Retries:
         Retries up to 3 times with exponential backoff on exceptions.
     """
-    notification = Notification.objects.get(id=notification_id)
+    # Same shape as the email task: one narrow SELECT, one UPDATE.
+    recipient_email = Notification.objects.filter(
+        id=notification_id
+    ).values_list('recipient__email', flat=True).get()
     success = send_mock_sms(
-        notification.recipient,
+        recipient_email,
         message[:160]
     )
-    notification.sms_status = success
-    notification.sms_task_id = None
-    notification.save(update_fields=['sms_status', 'sms_task_id'])
\ No newline at end of file
+    Notification.objects.filter(id=notification_id).update(
+        sms_status=success,
+        sms_task_id=None,
+    )
\ No newline at end of file
@@ -1,50 +1,165 @@
+import functools
+import time
+from uuid import uuid4
+
+from celery import shared_task
+
+from django.core.cache import cache
+from django.db import transaction
+
+from smartnotify import celery_app
+
 from apps.notifications.notifications_tasks import send_email_notification, send_sms_notification
 from .models import Notification, NotificationPreference
 from apps.notifications.models import ThreadSubscription,Comment
 
-def dispatch_comment_notification(comment: Comment) -> None:
+# Preferences change rarely, so an hour of staleness is acceptable.
+PREFERENCE_CACHE_TIMEOUT = 3600
+
+# Process-local L1 in front of Redis: repeated lookups for the same user
+# within one worker skip even the Redis round-trip. Other processes cannot
+# see our invalidation, so the short TTL bounds cross-process staleness.
+LOCAL_PREFERENCE_TTL = 60
+LOCAL_PREFERENCE_MAX_ENTRIES = 10_000
+
+_local_preferences: dict = {}
+
+def _local_preference_get(user_id: int) -> dict | None:
+    entry = _local_preferences.get(user_id)
+    if entry is None:
+        return None
+    expires_at, pref = entry
+    if time.monotonic() >= expires_at:
+        _local_preferences.pop(user_id, None)
+        return None
+    return pref
+
+def _local_preference_set(user_id: int, pref: dict) -> None:
+    if len(_local_preferences) >= LOCAL_PREFERENCE_MAX_ENTRIES:
+        # Crude but O(1) bound; entries repopulate on the next lookups.
+        _local_preferences.clear()
+    _local_preferences[user_id] = (time.monotonic() + LOCAL_PREFERENCE_TTL, pref)
+
+def invalidate_local_preference(user_id: int) -> None:
+    _local_preferences.pop(user_id, None)
+
+# The rendered GET response is cached for a shorter window; it is also
+# invalidated eagerly whenever the underlying row is saved.
+PREFERENCE_RESPONSE_CACHE_TIMEOUT = 300
+
+def preference_cache_key(user_id: int) -> str:
+    return f"notifpref:{user_id}"
+
+def preference_response_cache_key(user_id: int) -> str:
+    return f"notifpref:data:{user_id}"
+
+def get_cached_preferences(user_id: int) -> dict | None:
+    """
+    Fetch a user's notification preferences via the Redis cache.
+
+    Args:
+        user_id (int): Primary key of the user whose preferences are needed.
+
+    Returns:
+        dict | None: Mapping with `in_app`, `email` and `sms` flags, or None
+        if the user has no NotificationPreference row.
+
+    Notes:
+        - Lookup order is process-local TTL cache, then Redis, then a single
+          narrow DB query; each miss populates the layers above it.
+        - Both cache layers are invalidated on NotificationPreference save
+          (see signals); the local layer additionally expires after
+          LOCAL_PREFERENCE_TTL to bound staleness in other processes.
+    """
+    pref = _local_preference_get(user_id)
+    if pref is not None:
+        return pref
+    key = preference_cache_key(user_id)
+    pref = cache.get(key)
+    if pref is None:
+        row = NotificationPreference.objects.filter(user_id=user_id).only(
+            'in_app', 'email', 'sms'
+        ).first()
+        if row is None:
+            return None
+        pref = {'in_app': row.in_app, 'email': row.email, 'sms': row.sms}
+        cache.set(key, pref, PREFERENCE_CACHE_TIMEOUT)
+    _local_preference_set(user_id, pref)
+    return pref
+
+@shared_task
+def dispatch_comment_notification(comment_id: int) -> None:
     """
     Dispatch notifications for a new comment on a thread.
 
     Args:
-        comment (Comment): The comment instance that triggered the notification.
+        comment_id (int): Primary key of the comment that triggered the
+            notification. Runs as a Celery task so the comment POST returns
+            without waiting on the fan-out.
 
     Process:
         - Finds all thread subscribers excluding the comment author.
         - Checks their notification preferences.
-        - Creates Notification objects accordingly.
-        - Triggers asynchronous email and SMS notification tasks.
-        - Updates Notification records with Celery task IDs.
+        - Creates Notification objects (with pre-generated Celery task IDs)
+          in one bulk INSERT.
+        - Triggers asynchronous email and SMS notification tasks under the
+          same pre-generated task IDs.
 
     Notes:
         - Notifications are created in bulk for efficiency.
         - Email and SMS tasks are queued only if user preferences allow.
+        - Comments deleted before the worker picks the task up are ignored.
     """
+    comment = Comment.objects.select_related('thread', 'user').filter(id=comment_id).first()
+    if comment is None:
+        return
+
+    # New threads usually have no subscribers besides the author; one
+    # indexed EXISTS probe skips the JOIN and fan-out entirely then.
+    if not ThreadSubscription.objects.filter(
+        thread_id=comment.thread_id
+    ).exclude(user_id=comment.user_id).exists():
+        return
+
     thread = comment.thread
-    
+
+    # One JOINed query brings each subscriber and their preference row
+    # together; the projection keeps the SELECT list to the columns the
+    # fan-out actually reads.
     subscriptions = ThreadSubscription.objects.filter(
         thread=thread
-    ).exclude(user=comment.user).select_related('user')
-    
-    user_ids = [sub.user_id for sub in subscriptions]
-    preferences = NotificationPreference.objects.filter(
-        user_id__in=user_ids
-    ).in_bulk(field_name='user_id')
-    
+    ).exclude(user_id=comment.user_id).select_related(
+        'user__notification_preference'
+    ).only(
+        'user__id',
+        'user__email',
+        'user__notification_preference__in_app',
+        'user__notification_preference__email',
+        'user__notification_preference__sms',
+    )
+
+    # Identical for every subscriber, so build once; the comment fetch
+    # select_related'd user and thread, so no lazy loads fire here either.
+    message = f"New comment on '{thread.title}' by {comment.user.email}"
+    subject = "New Comment Posted"
+
     notifications = []
-    email_tasks = []
-    sms_tasks = []
-    
+
     for subscription in subscriptions:
         user = subscription.user
-        pref = preferences.get(user.id)
-        
+        # RelatedObjectDoesNotExist subclasses AttributeError, so getattr
+        # degrades to None for users without a preference row.
+        pref = getattr(user, 'notification_preference', None)
+
         if not pref:
             continue
-            
-        message = f"New comment on '{thread.title}' by {comment.user.email}"
-        subject = "New Comment Posted"
-        
+
+        # All channels off means the row would never surface anywhere;
+        # skip the INSERT entirely.
+        if not (pref.in_app or pref.email or pref.sms):
+            continue
+
+
         notification = Notification(
             recipient=user,
             comment=comment,
@@ -52,41 +167,50 @@ def dispatch_comment_notification(comment: Comment) -> None:
             in_app_status=pref.in_app,
             is_read=False
         )
-        
+
+        # Celery task ids are client-side UUIDs, so they can be minted
+        # before the INSERT and handed to apply_async(task_id=...) later;
+        # the rows land with their final ids in the first write.
         if pref.email:
-            notification.email_status = False
-            notification.email_task_id = "pending"
-        else:
-            notification.email_status = False
-            
+            notification.email_task_id = uuid4().hex
+
         if pref.sms:
-            notification.sms_status = False
-            notification.sms_task_id = "pending"
-        else:
-            notification.sms_status = False
-            
+            notification.sms_task_id = uuid4().hex
+
         notifications.append(notification)
     
-    created_notifications = Notification.objects.bulk_create(notifications)
-    
-    for notification in created_notifications:
-        if notification.email_task_id == "pending":
-            task = send_email_notification.delay(notification.id,subject,message)
-            notification.email_task_id = task.id
-            email_tasks.append(notification.id)
-            
-        if notification.sms_task_id == "pending":
-            task = send_sms_notification.delay(notification.id,message)
-            notification.sms_task_id = task.id
-            sms_tasks.append(notification.id)
-    
-    if email_tasks:
-        Notification.objects.filter(id__in=email_tasks).update(
-            email_task_id=send_email_notification.AsyncResult(email_tasks[0]).task_id
+    def publish_tasks(created):
+        # Every .delay() opens its own broker round-trip; acquiring one
+        # producer from the pool lets all publishes for this comment share a
+        # single connection/channel. Task ids were stamped before the
+        # INSERT, so no follow-up write is needed.
+        with celery_app.producer_pool.acquire(block=True) as producer:
+            for notification in created:
+                if notification.email_task_id:
+                    send_email_notification.apply_async(
+                        (notification.id, subject, message),
+                        task_id=notification.email_task_id,
+                        producer=producer,
+                    )
+
+                if notification.sms_task_id:
+                    send_sms_notification.apply_async(
+                        (notification.id, message),
+                        task_id=notification.sms_task_id,
+                        producer=producer,
+                    )
+
+    # batch_size keeps each INSERT under Postgres' parameter limits on big
+    # fan-outs; the atomic block makes the batches one all-or-nothing
+    # commit (and one WAL fsync) instead of one per batch. The broker
+    # publishes are deferred to on_commit so a send task can never run
+    # before its notification row is visible (which would burn its retry
+    # budget on DoesNotExist); outside any transaction the callback fires
+    # immediately.
+    with transaction.atomic():
+        created_notifications = Notification.objects.bulk_create(
+            notifications, batch_size=500
         )
-        
-    if sms_tasks:
-        Notification.objects.filter(id__in=sms_tasks).update(
-            sms_task_id=send_sms_notification.AsyncResult(sms_tasks[0]).task_id
+        transaction.on_commit(
+            functools.partial(publish_tasks, created_notifications)
         )
-        
@@ -1,6 +1,8 @@
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from apps.notifications.models import Comment
+from apps.notifications.models import Comment, NotificationPreference
 
 @receiver(post_save, sender=Comment)
 def handle_new_comment(sender, instance: Comment, created: bool, **kwargs) -> None:
@@ -14,8 +16,39 @@ def handle_new_comment(sender, instance: Comment, created: bool, **kwargs) -> No
         **kwargs: Additional keyword arguments.
 
     Process:
-        - When a new comment is created, calls dispatch_comment_notification to send notifications.
+        - When a new comment is created, enqueues dispatch_comment_notification
+          on the Celery worker once the surrounding transaction commits, so
+          the request path does none of the fan-out work and the task never
+          races an uncommitted comment row.
     """
     if created:
         from .services import dispatch_comment_notification # noqa: F821
-        dispatch_comment_notification(instance)
\ No newline at end of file
+        transaction.on_commit(
+            lambda comment_id=instance.id: dispatch_comment_notification.delay(comment_id)
+        )
+
+@receiver(post_save, sender=NotificationPreference)
+def invalidate_preference_cache(sender, instance: NotificationPreference, **kwargs) -> None:
+    """
+    Signal handler to drop the cached preferences when a NotificationPreference changes.
+
+    Args:
+        sender: The model class (NotificationPreference).
+        instance: The NotificationPreference instance saved.
+        **kwargs: Additional keyword arguments.
+
+    Process:
+        - Deletes the Redis cache entries (channel flags and rendered GET
+          response) and this process's local entry so the next lookup
+          re-reads the DB.
+    """
+    from .services import ( # noqa: F821
+        invalidate_local_preference,
+        preference_cache_key,
+        preference_response_cache_key,
+    )
+    invalidate_local_preference(instance.user_id)
+    cache.delete_many([
+        preference_cache_key(instance.user_id),
+        preference_response_cache_key(instance.user_id),
+    ])
\ No newline at end of file
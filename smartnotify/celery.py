@@ -5,7 +5,7 @@ from celery.schedules import crontab
 
 from django.conf import settings
 
-from smartnotify.settings.configurations import BaseConfiguration as project_config
+from smartnotify.settings import configurations as project_config
 
 
 # Set the default Django settings module for the 'celery' program.
@@ -20,7 +20,7 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks(lambda: settings.INSTALLED_APPS)
 
 app.conf.update(
-    broker_url= project_config.CELERY_BROKER_URL.value,  
+    broker_url= project_config.CELERY_BROKER_URL,
     timezone='Asia/Kathmandu',     
 )
 
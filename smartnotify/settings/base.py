@@ -1,21 +1,20 @@
-import environ
 from pathlib import Path
-from smartnotify.settings.configurations import BaseConfiguration as project_config
+from smartnotify.settings import configurations as project_config
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-env = environ.Env()
-env.read_env(str(BASE_DIR.parent / ".env"))
+# configurations.py performed the one and only .env read on import above.
+env = project_config.env
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = project_config.SECRET_KEY.value
+SECRET_KEY = project_config.SECRET_KEY
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True if project_config.DEBUG.value else False
+DEBUG = True if project_config.DEBUG else False
 
 ALLOWED_HOSTS = []
 
@@ -91,8 +90,8 @@ REST_FRAMEWORK = {
         "django_filters.rest_framework.DjangoFilterBackend",
     ],
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.UserRateThrottle',
-        'rest_framework.throttling.AnonRateThrottle',
+        'apps.core.throttling.RedisUserRateThrottle',
+        'apps.core.throttling.RedisAnonRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         'user': '100/day',
@@ -114,7 +113,14 @@ SPECTACULAR_SETTINGS = {
     "SERVE_INCLUDE_SCHEMA": False,
 }
 
-CELERY_BROKER_URL =project_config.CELERY_BROKER_URL.value
+CELERY_BROKER_URL = project_config.CELERY_BROKER_URL
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": project_config.REDIS_CACHE_URL,
+    }
+}
 
 WSGI_APPLICATION = 'smartnotify.wsgi.application'
 
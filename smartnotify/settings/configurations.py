@@ -1,19 +1,21 @@
 """To handle all the configuration related to the projects."""
 
-import os
-from enum import Enum
-from dotenv import load_dotenv
-from setuptools._distutils.util import strtobool
+from pathlib import Path
 
+import environ
 
-# load the environments variable from .env file located at root of the project.
-dotenv_path = os.path.join(os.getcwd(), ".env")
-env = load_dotenv(dotenv_path=dotenv_path, override=True)
 
+# Single .env read for the whole project. This module is imported at the top
+# of settings/base.py, so the environment is populated before any constant
+# below — or base.py itself — reads from it.
+BASE_DIR = Path(__file__).resolve().parent.parent
+env = environ.Env()
+env.read_env(str(BASE_DIR.parent / ".env"))
 
-class BaseConfiguration(Enum):
-    """To manage all the base configuration of the project."""
 
-    DEBUG = bool(strtobool(os.getenv("DEBUG", "False")))
-    SECRET_KEY = os.getenv("SECRET_KEY")
-    CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL")
+# Plain module-level constants: callsites read them with a single attribute
+# lookup instead of the former Enum member + .value descriptor walk.
+DEBUG = env.bool("DEBUG", default=False)
+SECRET_KEY = env.str("SECRET_KEY", default=None)
+CELERY_BROKER_URL = env.str("CELERY_BROKER_URL", default=None)
+REDIS_CACHE_URL = env.str("REDIS_CACHE_URL", default="redis://localhost:6379/1")